@@ -0,0 +1,74 @@
+# ms-ai-demo/clients.py
+"""Azure 자격증명/클라이언트 싱글톤 팩토리.
+
+모듈마다 클라이언트를 따로 만들면 MSAL 토큰 캐시와 HTTP 커넥션 풀이
+공유되지 않아 호출마다 AAD 토큰 발급과 TLS 핸드셰이크가 반복된다.
+lru_cache 팩토리로 프로세스당 하나만 만들어 모든 모듈이 같이 쓴다.
+"""
+import atexit
+import os
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+# Streamlit 구동 시에는 cache_resource로도 감싸 리런/세션 간 재생성을 막는다.
+# (CLI 등 비-Streamlit 진입점에서도 동작해야 하므로 임포트 실패 시 no-op)
+try:
+    import streamlit as _st
+
+    _cache_resource = _st.cache_resource
+except Exception:
+
+    def _cache_resource(func):
+        return func
+
+
+load_dotenv()
+
+
+@_cache_resource
+@lru_cache(maxsize=1)
+def get_credential():
+    from azure.identity import DefaultAzureCredential
+
+    return DefaultAzureCredential()
+
+
+@_cache_resource
+@lru_cache(maxsize=1)
+def get_openai():
+    from openai import AzureOpenAI
+
+    client = AzureOpenAI(
+        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+        api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
+        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+    )
+    # 수명 동안 httpx keep-alive 풀을 유지하고, 소켓 정리는 프로세스 종료 시에만
+    atexit.register(client.close)
+    return client
+
+
+@_cache_resource
+@lru_cache(maxsize=1)
+def get_openai_async():
+    import httpx
+    from openai import AsyncAzureOpenAI
+
+    return AsyncAzureOpenAI(
+        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+        api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
+        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20)
+        ),
+    )
+
+
+@_cache_resource
+@lru_cache(maxsize=1)
+def get_project():
+    # transport 튜닝이 들어간 news_scraper의 클라이언트를 그대로 재사용
+    from news_scraper import _project
+
+    return _project()
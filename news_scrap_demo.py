@@ -1,10 +1,138 @@
 # ms-ai-demo/news_scrap_demo.py
+import functools
 import json
 import collections
+from datetime import datetime
 from urllib.parse import urlparse
 import streamlit as st
 
+# JSON 직렬화 가속 (C 확장, bytes 직접 반환) — 없으면 stdlib 폴백
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 한국 주요 IT/경제 매체 프리셋 (수정 가능한 기본값)
+_PRESET_SITES = """news.naver.com
+zdnet.co.kr
+it.chosun.com
+etnews.com
+hankyung.com
+mk.co.kr
+yonhapnews.co.kr
+newsis.com
+news1.kr
+bloter.net
+seoul.co.kr
+hankookilbo.com
+inews24.com
+chosun.com
+joongang.co.kr
+donga.com
+hani.co.kr
+kyunghyang.com
+mt.co.kr
+edaily.co.kr
+moneys.co.kr
+heraldcorp.com
+ohmynews.com
+pressian.com
+segye.com
+munhwa.com
+asiatoday.co.kr
+ytn.co.kr
+jtbc.co.kr
+sbs.co.kr
+kbs.co.kr
+imbc.co.kr
+tvchosun.com
+hankooki.com
+kookje.co.kr
+busan.com"""
+
+
+def _site_expr(sites_text: str) -> str:
+    """줄바꿈 구분 사이트 목록 → 'site:a OR site:b ...' 표현식."""
+    sites = [s.strip() for s in (sites_text or "").splitlines() if s.strip()]
+    if not sites:
+        return ""
+    return "site:" + " OR site:".join(sites)
+
+
+# 프리셋 그대로 쓰는 흔한 경우는 파싱 없이 미리 만든 표현식 재사용
+_PRESET_SITE_EXPR = _site_expr(_PRESET_SITES)
+
+
+@st.cache_data(show_spinner=False)
+def _attach_site_filters(q: str, sites_text: str) -> str:
+    """사이트 목록을 site: 필터로 묶어 쿼리에 합성 (리런마다 재파싱하지 않음)."""
+    if (sites_text or "").strip() == _PRESET_SITES:
+        expr = _PRESET_SITE_EXPR
+    else:
+        expr = _site_expr(sites_text)
+    if not expr:
+        return q
+    return f"({q}) AND ({expr})"
+
+
+@functools.lru_cache(maxsize=4096)
+def _domain(u: str) -> str:
+    """URL → 도메인. 리런마다 같은 URL을 다시 urlparse하지 않도록 캐시."""
+    try:
+        netloc = urlparse(u or "").netloc.lower()
+        return netloc.replace("www.", "")
+    except Exception:
+        return ""
+
+
+@st.cache_data(show_spinner=False)
+def _domain_counts(urls: tuple) -> list:
+    """출처 요약용 상위 도메인 집계."""
+    return collections.Counter(map(_domain, urls)).most_common(9)
+
+
+@st.cache_data(show_spinner=False)
+def _docx_report_bytes(items: list, query: str, freshness: str, market: str) -> bytes:
+    """업로드용 DOCX 직렬화. 같은 결과셋이면 재직렬화하지 않는다."""
+    return generate_docx_bytes(
+        items,
+        title="Pressm AI — 뉴스 스크랩 리포트",
+        query=query,
+        freshness=freshness,
+        market=market,
+        generated_at=datetime.now().isoformat(timespec="seconds"),
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _json_bytes(items: list) -> bytes:
+    """다운로드 버튼용 JSON bytes. 리런마다 재직렬화하지 않도록 캐시."""
+    if orjson is not None:
+        return orjson.dumps(items, option=orjson.OPT_INDENT_2)
+    return json.dumps(items, ensure_ascii=False, indent=2).encode("utf-8")
+
 from news_scraper import search_news, search_news_multi, NewsError
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_search_news(q: str, count: int, freshness: str, market: str) -> list:
+    """같은 조건의 재검색(위젯 리런 포함)은 5분간 결과를 재사용."""
+    return search_news(q, count=count, freshness=freshness, market=market)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_search_news_multi(
+    q: str, count: int, freshness: str, market: str, target_results: int
+) -> list:
+    return search_news_multi(
+        q=q,
+        count=count,
+        freshness=freshness,
+        market=market,
+        target_results=target_results,
+        max_rounds=3,
+    )
 from storage_utils import (
     upload_json,  # (현재 화면에서는 사용하지 않지만 import 유지해도 무방)
     sas_url,
@@ -20,22 +148,6 @@ from storage_utils import (
 
 def render_news_scrap_demo():
 
-    # ── 유틸 ────────────────────────────────────────────────────────
-    def _attach_site_filters(q: str, sites_text: str) -> str:
-        """줄바꿈 입력된 사이트 목록을 site: 필터로 묶어 쿼리에 합성"""
-        sites = [s.strip() for s in (sites_text or "").splitlines() if s.strip()]
-        if not sites:
-            return q
-        site_expr = " OR ".join([f"site:{s}" for s in sites])
-        return f"({q}) AND ({site_expr})"
-
-    def _domain(u: str) -> str:
-        try:
-            netloc = urlparse(u or "").netloc.lower()
-            return netloc.replace("www.", "")
-        except Exception:
-            return ""
-
     # ── 기본 UI ─────────────────────────────────────────────────────
 
     # 세션 상태 키 보장
@@ -60,46 +172,8 @@ def render_news_scrap_demo():
 
         preset = st.toggle("🇰🇷 한국 주요 IT/경제 매체 프리셋 사용", value=True)
         if preset:
-            preset_sites = """
-    news.naver.com
-    zdnet.co.kr
-    it.chosun.com
-    etnews.com
-    hankyung.com
-    mk.co.kr
-    yonhapnews.co.kr
-    newsis.com
-    news1.kr
-    bloter.net
-    seoul.co.kr
-    hankookilbo.com
-    inews24.com
-    chosun.com
-    joongang.co.kr
-    donga.com
-    hani.co.kr
-    kyunghyang.com
-    mt.co.kr
-    edaily.co.kr
-    moneys.co.kr
-    heraldcorp.com
-    ohmynews.com
-    pressian.com
-    segye.com
-    munhwa.com
-    asiatoday.co.kr
-    ytn.co.kr
-    jtbc.co.kr
-    sbs.co.kr
-    kbs.co.kr
-    imbc.co.kr
-    tvchosun.com
-    hankooki.com
-    kookje.co.kr
-    busan.com
-    """.strip()
             sites_text = st.text_area(
-                "사이트 필터 (수정 가능)", preset_sites, height=150
+                "사이트 필터 (수정 가능)", _PRESET_SITES, height=150
             )
         else:
             sites_text = st.text_area("사이트 필터 (선택, 줄바꿈)", "", height=80)
@@ -117,18 +191,11 @@ def render_news_scrap_demo():
             with st.spinner("에이전트 호출 중..."):
                 compound_q = _attach_site_filters(q, sites_text)
                 if multi:
-                    items = search_news_multi(
-                        q=compound_q,
-                        count=count,
-                        freshness=freshness,
-                        market=market,
-                        target_results=target_results,
-                        max_rounds=3,
+                    items = _cached_search_news_multi(
+                        compound_q, count, freshness, market, target_results
                     )
                 else:
-                    items = search_news(
-                        q=compound_q, count=count, freshness=freshness, market=market
-                    )
+                    items = _cached_search_news(compound_q, count, freshness, market)
             st.session_state["items"] = items
             st.success(f"가져온 기사: {len(items)}건")
         except NewsError as e:
@@ -156,11 +223,11 @@ def render_news_scrap_demo():
 
         # 출처 요약
         st.markdown("### 📚 수집 출처 요약")
-        counter = collections.Counter(
-            _domain(it.get("url", "")) for it in items if it.get("url")
+        top_domains = _domain_counts(
+            tuple(it.get("url", "") for it in items if it.get("url"))
         )
         cols = st.columns(3)
-        for i, (dom, cnt) in enumerate(counter.most_common(9)):
+        for i, (dom, cnt) in enumerate(top_domains):
             with cols[i % 3]:
                 st.write(f"- **{dom}** × {cnt}")
 
@@ -181,7 +248,7 @@ def render_news_scrap_demo():
         with c2:
             st.download_button(
                 "JSON 다운로드",
-                data=json.dumps(items, ensure_ascii=False, indent=2).encode("utf-8"),
+                data=_json_bytes(items),
                 file_name="pressm_news.json",
                 mime="application/json",
                 use_container_width=True,
@@ -201,23 +268,13 @@ def render_news_scrap_demo():
             help="예: docx/KT_20251030.docx — 반드시 'docx/' 아래에 저장됩니다.",
         )
 
-        # DOCX 생성
-        generated_at = __import__("datetime").datetime.now().__str__()
-        docx_bytes = generate_docx_bytes(
-            items,
-            title="Pressm AI — 뉴스 스크랩 리포트",
-            query=q,
-            freshness=freshness,
-            market=market,
-            generated_at=generated_at,
-        )
-
         # 업로드 버튼 (업로드만 남김)
         if st.button(
             "☁️ DOCX를 Blob에 업로드", use_container_width=True, key="upload_docx_btn"
         ):
             try:
                 with st.spinner("DOCX 업로드 중..."):
+                    # DOCX 직렬화는 upload_docx_report 안에서 1회만 일어난다
                     path = (docx_blob_path or "").strip()
                     if not path or not path.lower().startswith("docx/"):
                         path = "docx/" + (path or "pressm_report.docx")
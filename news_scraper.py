@@ -1,6 +1,12 @@
 # ms-ai-demo/news_scraper.py
-import os, json, time
+import os, sys, json, time, random, threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
 from typing import List, Dict, Any, Optional
 
 # --- 날짜/타임존 유틸 ---
@@ -8,14 +14,26 @@ from datetime import datetime, timedelta, timezone
 import calendar
 import re
 
+import requests
+from requests.adapters import HTTPAdapter
+
 from dotenv import load_dotenv
+from azure.core.pipeline.transport import RequestsTransport
 from azure.identity import DefaultAzureCredential
 from azure.ai.projects import AIProjectClient
 from azure.ai.agents.models import BingGroundingTool
 
-from urllib.parse import urlparse
+from clients import get_credential
+
+from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
 import collections
 
+# JSON 파싱/직렬화 가속 (C 확장, 대량 응답에서 체감) — 없으면 stdlib 폴백
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # =========================
 # Env & Globals
@@ -30,8 +48,16 @@ BING_CONN_NAME = (os.getenv("BING_CONNECTION_NAME") or "").strip()
 DEBUG = (os.getenv("DEBUG") or "0").strip() in ("1", "true", "True")
 
 KST = timezone(timedelta(hours=9))
+# 날짜 없는 항목 정렬용 센티널 — 비교마다 새 datetime을 만들지 않는다
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 _ISO_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
 
+# 질의 변형용 패턴 — 멀티패스 루프에서 반복 호출되므로 임포트 시 1회 컴파일
+_SITE_GROUP_RE = re.compile(r"\(\s*site:[^)]+\)", re.IGNORECASE)
+_SITE_RE = re.compile(r"site:\S+", re.IGNORECASE)
+_WS_RE = re.compile(r"\s{2,}")
+_BOOL_RE = re.compile(r"\b(?:AND|OR)\b")
+
 
 class NewsError(Exception):
     pass
@@ -40,7 +66,39 @@ class NewsError(Exception):
 _credential: Optional[DefaultAzureCredential] = None
 _project_client: Optional[AIProjectClient] = None
 _agent_cache: Optional[dict] = None
+_agent_tools_synced = False  # 이번 프로세스에서 tools 반영(update/create)을 마쳤는지
 _AGENT_NAME = "pressm-bing-agent"
+# JSON 모드: 응답이 항상 파싱 가능한 JSON 객체로 오도록 강제 → 재실행 경로 제거
+_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Streamlit은 세션마다 별도 스레드에서 스크립트를 실행하므로
+# 전역 초기화(클라이언트/에이전트)는 락으로 보호한다.
+_init_lock = threading.Lock()
+_agent_lock = threading.Lock()
+
+# 프로세스 재시작 시 list_agents() 전체 스캔을 피하기 위한 에이전트 ID 캐시 파일
+_AGENT_ID_FILE = Path.home() / ".cache" / "pressm" / "agent.json"
+
+
+def _load_cached_agent_id() -> Optional[str]:
+    try:
+        data = json.loads(_AGENT_ID_FILE.read_text(encoding="utf-8"))
+        if data.get("endpoint") == PROJECT_ENDPOINT:
+            return data.get("agent_id") or None
+    except Exception:
+        pass
+    return None
+
+
+def _save_cached_agent_id(agent_id: str):
+    try:
+        _AGENT_ID_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _AGENT_ID_FILE.write_text(
+            json.dumps({"endpoint": PROJECT_ENDPOINT, "agent_id": agent_id}),
+            encoding="utf-8",
+        )
+    except Exception:
+        pass  # 캐시 실패는 치명적이지 않음
 
 
 # =========================
@@ -56,11 +114,25 @@ def _project() -> AIProjectClient:
     if not PROJECT_ENDPOINT:
         raise NewsError("AZURE_AI_PROJECT_ENDPOINT가 비어 있습니다. (.env 확인)")
     if _project_client is None:
-        _credential = DefaultAzureCredential()
-        _project_client = AIProjectClient(
-            endpoint=PROJECT_ENDPOINT, credential=_credential
-        )
-        _log(f"AIProjectClient initialized: endpoint={PROJECT_ENDPOINT}")
+        with _init_lock:
+            if _project_client is None:
+                # 동시 세션이 소켓 몇 개를 두고 경합하지 않도록 keep-alive 풀을 넉넉히
+                session = requests.Session()
+                session.mount(
+                    "https://",
+                    HTTPAdapter(
+                        pool_connections=32, pool_maxsize=64, pool_block=False
+                    ),
+                )
+                _credential = get_credential()
+                _project_client = AIProjectClient(
+                    endpoint=PROJECT_ENDPOINT,
+                    credential=_credential,
+                    transport=RequestsTransport(
+                        session=session, connection_timeout=10, read_timeout=180
+                    ),
+                )
+                _log(f"AIProjectClient initialized: endpoint={PROJECT_ENDPOINT}")
     return _project_client
 
 
@@ -72,13 +144,21 @@ def _domain(u: str) -> str:
         return ""
 
 
+_bing_tools_cache: Optional[list] = None
+
+
 def _get_bing_tool_definitions():
     """
     프로젝트 Connections에서 Grounding with Bing Search 연결의 connection_id를 찾아
     BingGroundingTool.definitions 반환.
     - BING_CONNECTION_NAME이 있으면 이름으로 조회
     - 없으면 Ground/Bing 계열 연결을 자동 검색해 첫 항목 사용
+    connection_id는 프로세스 수명 동안 사실상 고정이므로 첫 성공 후 캐시한다.
     """
+    global _bing_tools_cache
+    if _bing_tools_cache is not None:
+        return _bing_tools_cache
+
     client = _project()
 
     # 1) 이름 지정된 경우
@@ -90,86 +170,158 @@ def _get_bing_tool_definitions():
             _log(
                 f"BING_CONNECTION_NAME={BING_CONN_NAME}, 연결 조회: id={conn.get('id')}"
             )
-            return BingGroundingTool(connection_id=conn["id"]).definitions
+            _bing_tools_cache = BingGroundingTool(connection_id=conn["id"]).definitions
+            return _bing_tools_cache
+        except NewsError:
+            raise
         except Exception as e:
             raise NewsError(
                 f"프로젝트에서 연결 '{BING_CONN_NAME}'을 찾을 수 없습니다. "
                 f"Connections 화면의 Name을 확인하세요. 상세: {e}"
             )
 
-    # 2) 자동 검색
-    candidates = []
-    for c in _project().connections.list():
+    # 2) 자동 검색 — 첫 후보만 쓰므로 발견 즉시 중단 (이미 받은 client 재사용)
+    conn = None
+    for c in client.connections.list():
         ctype = (c.get("connectionType") or "").lower()
-        if any(k in ctype for k in ("bing", "ground")):
-            candidates.append(c)
+        if "bing" in ctype or "ground" in ctype:
+            conn = c
+            break
 
-    if not candidates:
+    if conn is None:
         raise NewsError(
             "프로젝트에 Grounding/Bing 유형의 연결이 없습니다.\n"
             "- ai.azure.com → Project → Connections/Resources → "
             "Connect a Grounding with Bing Search 로 연결 추가"
         )
-
-    # 첫 후보 사용
-    conn = candidates[0]
     _log(
         f"Auto-picked connection: name={conn.get('name')} type={conn.get('connectionType')} id={conn.get('id')}"
     )
     if not conn.get("id"):
         raise NewsError("자동 선택된 연결에서 id를 찾지 못했습니다.")
-    return BingGroundingTool(connection_id=conn["id"]).definitions
+    _bing_tools_cache = BingGroundingTool(connection_id=conn["id"]).definitions
+    return _bing_tools_cache
+
+
+def _find_agent_by_name(client: AIProjectClient) -> Optional[dict]:
+    for ag in client.agents.list_agents():
+        if ag.get("name") == _AGENT_NAME:
+            _log(f"Reusing existing agent: id={ag.get('id')}")
+            return ag
+    return None
 
 
 def _ensure_agent() -> dict:
     """
-    같은 이름(_AGENT_NAME)의 에이전트가 있으면 재사용, 없으면 생성/업데이트
+    같은 이름(_AGENT_NAME)의 에이전트가 있으면 재사용, 없으면 생성/업데이트.
+    에이전트 ID는 디스크에도 캐시해 프로세스 재시작 시 전체 스캔을 건너뛴다.
+    동시 Streamlit 리런에서 레이스가 나지 않게 락으로 보호.
     """
-    global _agent_cache
-    client = _project()
+    global _agent_cache, _agent_tools_synced
+
+    with _agent_lock:
+        # 이미 이 프로세스에서 tools까지 맞춰둔 에이전트면 RTT 없이 바로 반환
+        if _agent_cache is not None and _agent_tools_synced:
+            return _agent_cache
+
+        client = _project()
+
+        # 에이전트 조회와 Bing 연결 조회는 독립적인 REST 호출이므로
+        # 콜드 스타트에서 겹쳐 실행한다 (sum(지연) → max(지연))
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            tools_fut = ex.submit(_get_bing_tool_definitions)
+
+            from_disk = False
+            if _agent_cache is None:
+                cached_id = _load_cached_agent_id()
+                if cached_id:
+                    # 값싼 get_agent 1회로 검증 — 유효하면 O(N) list_agents 스캔 생략
+                    try:
+                        _agent_cache = client.agents.get_agent(cached_id)
+                        from_disk = True
+                        _log(f"Verified cached agent id: {cached_id}")
+                    except Exception:
+                        _log("Cached agent id invalid → list_agents() 폴백")
+            if _agent_cache is None:
+                _agent_cache = _find_agent_by_name(client)
+
+            tools_def = tools_fut.result()
 
-    if _agent_cache is None:
-        for ag in client.agents.list_agents():
-            if ag.get("name") == _AGENT_NAME:
-                _agent_cache = ag
-                _log(f"Reusing existing agent: id={ag.get('id')}")
-                break
-
-    tools_def = _get_bing_tool_definitions()
-
-    try:
-        if _agent_cache is None:
-            if not MODEL_DEPLOYMENT:
-                raise NewsError("MODEL_DEPLOYMENT가 비어 있습니다. (.env의 배포명)")
-            _agent_cache = client.agents.create_agent(
-                model=MODEL_DEPLOYMENT,
-                name=_AGENT_NAME,
-                instructions=(
-                    "너는 한국어 뉴스 리서처다. 필요할 때 Grounding with Bing Search 도구를 사용한다. "
-                    "사용자 요청에 따라 최신 뉴스를 찾아, 오직 JSON 배열로만 응답하라. "
-                    "허위 추정 금지, 불명확하면 빈 문자열로 둔다."
-                ),
-                tools=tools_def,
-            )
-            _log(f"Created agent: id={_agent_cache.get('id')}")
-        else:
-            _agent_cache = client.agents.update_agent(
-                agent_id=_agent_cache["id"], tools=tools_def
+        try:
+            if _agent_cache is None:
+                if not MODEL_DEPLOYMENT:
+                    raise NewsError("MODEL_DEPLOYMENT가 비어 있습니다. (.env의 배포명)")
+                _agent_cache = client.agents.create_agent(
+                    model=MODEL_DEPLOYMENT,
+                    name=_AGENT_NAME,
+                    instructions=(
+                        "너는 한국어 뉴스 리서처다. 필요할 때 Grounding with Bing Search 도구를 사용한다. "
+                        '사용자 요청에 따라 최신 뉴스를 찾아, 오직 JSON 객체로만 응답하라 (예: {"items": [...]}). '
+                        "허위 추정 금지, 불명확하면 빈 문자열로 둔다."
+                    ),
+                    tools=tools_def,
+                    response_format=_RESPONSE_FORMAT,
+                )
+                _log(f"Created agent: id={_agent_cache.get('id')}")
+            else:
+                try:
+                    _agent_cache = client.agents.update_agent(
+                        agent_id=_agent_cache["id"],
+                        tools=tools_def,
+                        response_format=_RESPONSE_FORMAT,
+                    )
+                except Exception:
+                    if not from_disk:
+                        raise
+                    # 디스크 캐시의 ID가 더 이상 유효하지 않은 경우 → 전체 조회로 복구
+                    _log("Cached agent id stale, falling back to list_agents()")
+                    _agent_cache = _find_agent_by_name(client)
+                    if _agent_cache is None:
+                        if not MODEL_DEPLOYMENT:
+                            raise NewsError(
+                                "MODEL_DEPLOYMENT가 비어 있습니다. (.env의 배포명)"
+                            )
+                        _agent_cache = client.agents.create_agent(
+                            model=MODEL_DEPLOYMENT,
+                            name=_AGENT_NAME,
+                            instructions=(
+                                "너는 한국어 뉴스 리서처다. 필요할 때 Grounding with Bing Search 도구를 사용한다. "
+                                '사용자 요청에 따라 최신 뉴스를 찾아, 오직 JSON 객체로만 응답하라 (예: {"items": [...]}). '
+                                "허위 추정 금지, 불명확하면 빈 문자열로 둔다."
+                            ),
+                            tools=tools_def,
+                            response_format=_RESPONSE_FORMAT,
+                        )
+                    else:
+                        _agent_cache = client.agents.update_agent(
+                            agent_id=_agent_cache["id"],
+                            tools=tools_def,
+                            response_format=_RESPONSE_FORMAT,
+                        )
+                _log(f"Updated agent tools: id={_agent_cache.get('id')}")
+        except NewsError:
+            raise
+        except Exception as e:
+            raise NewsError(
+                "에이전트 생성/업데이트 실패.\n"
+                "- Projects > Connections의 Grounding with Bing 연결 'Name'이 .env와 일치하는지\n"
+                "- Deployments의 모델 배포명이 MODEL_DEPLOYMENT와 일치하는지\n"
+                "- 현재 계정/구독/권한이 프로젝트와 일치하는지\n"
+                f"상세: {e}"
             )
-            _log(f"Updated agent tools: id={_agent_cache.get('id')}")
-    except Exception as e:
-        raise NewsError(
-            "에이전트 생성/업데이트 실패.\n"
-            "- Projects > Connections의 Grounding with Bing 연결 'Name'이 .env와 일치하는지\n"
-            "- Deployments의 모델 배포명이 MODEL_DEPLOYMENT와 일치하는지\n"
-            "- 현재 계정/구독/권한이 프로젝트와 일치하는지\n"
-            f"상세: {e}"
-        )
-    return _agent_cache
+
+        _agent_tools_synced = True
+        if _agent_cache.get("id"):
+            _save_cached_agent_id(_agent_cache["id"])
+        return _agent_cache
 
 
+@lru_cache(maxsize=4096)
 def _parse_dt_utc(dt_str: str) -> Optional[datetime]:
-    """published 문자열을 최대한 파싱해 UTC timezone-aware datetime 반환. 실패 시 None."""
+    """published 문자열을 최대한 파싱해 UTC timezone-aware datetime 반환. 실패 시 None.
+
+    정렬/필터에서 같은 문자열을 반복 파싱하므로 LRU 캐시로 메모이즈.
+    """
     if not dt_str:
         return None
     s = dt_str.strip()
@@ -226,26 +378,29 @@ def _kst_calendar_window(freshness: str) -> tuple[datetime, datetime]:
 # ------------ 멀티패스 확장 검색 ------------
 
 
-def _dedupe(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """URL(정규화) -> title(소문자) 순으로 중복 제거."""
-    seen = set()
-    out = []
+@lru_cache(maxsize=8192)
+def _norm_url(u: str) -> str:
+    """URL 정규화(utm_* 추적 파라미터 제거). 라운드 간 같은 URL 재파싱 방지용 캐시."""
+    try:
+        p = urlparse(u or "")
+        qs = parse_qs(p.query)
+        qs = {k: v for k, v in qs.items() if not k.lower().startswith("utm")}
+        new = p._replace(query=urlencode(qs, doseq=True))
+        return urlunparse(new)
+    except Exception:
+        return (u or "").strip()
 
-    def _norm_url(u: str) -> str:
-        try:
-            from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
 
-            p = urlparse(u or "")
-            # utm_* 등 추적 파라미터 제거
-            qs = parse_qs(p.query)
-            qs = {k: v for k, v in qs.items() if not k.lower().startswith("utm")}
-            new = p._replace(query=urlencode(qs, doseq=True))
-            return urlunparse(new)
-        except Exception:
-            return (u or "").strip()
+def _dedupe_key(it: Dict[str, Any]) -> str:
+    return _norm_url(it.get("url", "")) or (it.get("title", "").strip().lower())
+
 
+def _dedupe(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """URL(정규화) -> title(소문자) 순으로 중복 제거. 단일 패스 O(n)."""
+    seen = set()
+    out = []
     for it in items:
-        key = _norm_url(it.get("url", "")) or (it.get("title", "").strip().lower())
+        key = _dedupe_key(it)
         if not key or key in seen:
             continue
         seen.add(key)
@@ -261,12 +416,10 @@ def _remove_site_filters(q: str) -> str:
     """site: 도메인 조건을 걷어내 원문 쿼리만 남김."""
     if not q:
         return q
-    import re
-
     # 대충 (site:xxx OR site:yyy) 같은 구간 제거
-    q2 = re.sub(r"\(\s*site:[^)]+\)", "", q, flags=re.IGNORECASE)
-    q2 = re.sub(r"site:\S+", "", q2, flags=re.IGNORECASE)
-    q2 = re.sub(r"\s{2,}", " ", q2).strip()
+    q2 = _SITE_GROUP_RE.sub("", q)
+    q2 = _SITE_RE.sub("", q2)
+    q2 = _WS_RE.sub(" ", q2).strip()
     return q2
 
 
@@ -274,9 +427,8 @@ def _simplify_query(q: str) -> str:
     """따옴표/과한 OR/AND를 정리해 검색 폭을 넓힌 변형."""
     if not q:
         return q
-    q2 = q.replace("AND", " ").replace("OR", " ")
-    q2 = q2.replace("  ", " ").replace('"', "").strip()
-    return q2
+    q2 = _BOOL_RE.sub(" ", q).replace('"', "")
+    return _WS_RE.sub(" ", q2).strip()
 
 
 def search_news_multi(
@@ -312,26 +464,74 @@ def search_news_multi(
     need = max(target_results, min(count, 50))  # 목표 개수
     per_round = min(need, 20)  # 라운드당 요청 수 (너무 크게하면 품질 저하)
 
-    for i, rq in enumerate(uniq_rounds[:max_rounds], start=1):
-        try:
-            _log(f"[multi] round {i}/{max_rounds} q='{rq}'")
-            got = search_news(rq, count=per_round, freshness=freshness, market=market)
-            all_items.extend(got)
-            all_items = _dedupe(all_items)
-            _log(f"[multi] 누적 {len(all_items)}건 (이번 라운드 {len(got)}건)")
+    # 라운드는 서로 독립이므로 동시 실행 (search_news는 네트워크 대기가 지배적)
+    run_rounds = uniq_rounds[:max_rounds]
+    if not run_rounds:  # 빈 질의 — ThreadPoolExecutor(max_workers=0)는 ValueError
+        return []
+    with ThreadPoolExecutor(max_workers=len(run_rounds)) as ex:
+        futs = {
+            ex.submit(
+                search_news, rq, count=per_round, freshness=freshness, market=market
+            ): rq
+            for rq in run_rounds
+        }
+        # 라운드 간 seen 집합을 유지해 새 항목만 O(k) 추가 (누적 리스트 재스캔 방지)
+        seen_keys: set = set()
+        for f in as_completed(futs):
+            rq = futs[f]
+            try:
+                got = f.result()
+                added = 0
+                for it in got:
+                    key = _dedupe_key(it)
+                    if not key or key in seen_keys:
+                        continue
+                    seen_keys.add(key)
+                    all_items.append(it)
+                    added += 1
+                _log(f"[multi] q='{rq}' 완료 — 누적 {len(all_items)}건 (이번 라운드 신규 {added}건)")
+            except Exception as e:
+                _log(f"[multi] q='{rq}' 실패: {e}")
             if len(all_items) >= need:
+                # 목표 달성 → 아직 시작 안 한 라운드는 취소
+                for other in futs:
+                    other.cancel()
                 break
-        except Exception as e:
-            _log(f"[multi] round {i} 실패: {e}")
 
     # 필요하면 정렬(기존 search_news 내부에서도 정렬하지만, 합쳐졌으니 안전하게 한 번 더)
-    def _key_dt(it):
-        d = _parse_dt_utc(it.get("published"))
-        return (0, d) if d else (1, datetime.fromtimestamp(0, tz=timezone.utc))
+    # 정렬 키는 항목당 1회만 계산하고, C 구현 itemgetter로 키를 추출
+    decorated = [
+        (_parse_dt_utc(it.get("published")) or _EPOCH, i, it)
+        for i, it in enumerate(all_items)
+    ]
+    decorated.sort(key=itemgetter(0), reverse=True)
+
+    return [it for _, _, it in decorated[:need]]
+
+
+# 호출마다 threads.create() RTT를 내지 않도록 에이전트별로 thread를 재사용한다.
+# 같은 thread에 run이 동시에 2개 붙으면 충돌하므로(멀티패스 검색은 병렬 실행)
+# 풀에서 체크아웃/반납하는 방식으로만 공유한다.
+_thread_pool: Dict[str, list] = {}  # agent_id -> [(thread_id, uses), ...]
+_thread_pool_lock = threading.Lock()
+_THREAD_MAX_USES = 20  # 메시지가 쌓이면 서버 측 컨텍스트가 비대해지므로 주기적으로 교체
+
+
+def _acquire_thread(client, agent_id: str) -> tuple:
+    with _thread_pool_lock:
+        pool = _thread_pool.get(agent_id)
+        if pool:
+            return pool.pop()
+    thread = client.agents.threads.create()
+    return (thread["id"], 0)
 
-    all_items.sort(key=_key_dt, reverse=True)
 
-    return all_items[:need]
+def _release_thread(agent_id: str, thread_id: str, uses: int):
+    # 사용 한도에 도달한 thread는 반납하지 않고 폐기 (서버 측 수명 정책에 맡김)
+    if uses + 1 >= _THREAD_MAX_USES:
+        return
+    with _thread_pool_lock:
+        _thread_pool.setdefault(agent_id, []).append((thread_id, uses + 1))
 
 
 def _run_and_wait(agent_id: str, prompt: str, timeout_sec: int = 180) -> str:
@@ -340,12 +540,12 @@ def _run_and_wait(agent_id: str, prompt: str, timeout_sec: int = 180) -> str:
     - 완료 상태 문자열이 'completed' 또는 'succeeded'로 올 수 있어 둘 다 허용
     """
     client = _project()
-    thread = client.agents.threads.create()
-    client.agents.messages.create(thread_id=thread["id"], role="user", content=prompt)
+    thread_id, uses = _acquire_thread(client, agent_id)
+    client.agents.messages.create(thread_id=thread_id, role="user", content=prompt)
 
     # create_and_process로 즉시 실행
     run = client.agents.runs.create_and_process(
-        thread_id=thread["id"], agent_id=agent_id
+        thread_id=thread_id, agent_id=agent_id
     )
     _log(f"Run created: run_id={run['id']}")
 
@@ -353,8 +553,13 @@ def _run_and_wait(agent_id: str, prompt: str, timeout_sec: int = 180) -> str:
     TERMINAL_OK = {"completed", "succeeded"}
     TERMINAL_BAD = {"failed", "cancelled", "expired"}
 
+    # 고정 0.7s 폴링 대신 지수 백오프(+지터): 평균 폴링 횟수를 크게 줄이면서
+    # 빨리 끝나는 실행의 체감 지연은 유지
+    delay = 0.25
+    time.sleep(0.2)  # 즉시 끝난 실행의 빈 폴링 방지
+
     while True:
-        r = client.agents.runs.get(thread_id=thread["id"], run_id=run["id"])
+        r = client.agents.runs.get(thread_id=thread_id, run_id=run["id"])
         status = (r.get("status") or "").lower()
         _log(f"Run status: {status}")
 
@@ -367,72 +572,123 @@ def _run_and_wait(agent_id: str, prompt: str, timeout_sec: int = 180) -> str:
         if time.time() - start > timeout_sec:
             raise NewsError("에이전트 응답 대기 시간 초과")
 
-        time.sleep(0.7)
+        # 서버가 폴링 주기를 내려주면(retry_after) 그대로 따르고, 없으면 지수 백오프
+        retry_after = r.get("retry_after")
+        if retry_after:
+            time.sleep(float(retry_after))
+        else:
+            time.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(delay * 1.5, 5.0)
 
     # 마지막 assistant 메시지에서 응답 추출
     try:
         msg = client.agents.messages.get_last_message_by_role(
-            thread_id=thread["id"], role="assistant"
+            thread_id=thread_id, role="assistant"
         )
     except Exception:
-        msgs = list(client.agents.messages.list(thread_id=thread["id"]))
-        msg = next(
-            (
-                m
-                for m in reversed(msgs)
-                if (m.get("role") if isinstance(m, dict) else getattr(m, "role", None))
-                == "assistant"
-            ),
-            None,
-        )
+        msgs = list(client.agents.messages.list(thread_id=thread_id))
+        msg = _last_assistant(msgs)
+
+    # 정상 완료된 thread만 재사용 풀에 반납 (실패/타임아웃 thread는 폐기)
+    _release_thread(agent_id, thread_id, uses)
+    return _message_text(msg)
+
+
+def _last_assistant(msgs) -> Optional[Any]:
+    return next(
+        (
+            m
+            for m in reversed(list(msgs))
+            if (m.get("role") if isinstance(m, dict) else getattr(m, "role", None))
+            == "assistant"
+        ),
+        None,
+    )
+
+
+def _extract_text(p) -> Optional[str]:
+    """content part 하나에서 첫 번째 비어 있지 않은 텍스트를 꺼낸다. 없으면 None."""
+    if isinstance(p, dict):
+        t = p.get("text")
+        if isinstance(t, dict):
+            v = t.get("value")
+            if isinstance(v, str) and v.strip():
+                return v.strip()
+        v = p.get("value")
+        if isinstance(v, str) and v.strip():
+            return v.strip()
+        return None
+
+    txt_obj = getattr(p, "text", None)
+    if txt_obj is not None:
+        v = getattr(txt_obj, "value", None)
+        if isinstance(v, str) and v.strip():
+            return v.strip()
+    v = getattr(p, "value", None)
+    if isinstance(v, str) and v.strip():
+        return v.strip()
+    return None
+
+
+def _safe_preview(o, limit=400):
+    """에러 메시지용 응답 미리보기. 직렬화 불가능한 객체도 안전하게 문자열화."""
+    try:
+        if not isinstance(o, (str, int, float, bool, type(None), list, dict)):
+            o = getattr(o, "__dict__", str(o))
+        if orjson is not None:
+            return orjson.dumps(o, default=str).decode("utf-8")[:limit] + "..."
+        return json.dumps(o, ensure_ascii=False, default=str)[:limit] + "..."
+    except Exception:
+        return str(o)[:limit] + "..."
+
 
+def _message_text(msg) -> str:
+    """assistant 메시지의 content parts에서 텍스트를 모아 하나로 합친다."""
     if not msg:
         raise NewsError("assistant 메시지를 찾지 못했습니다.")
 
     parts = (
         msg.get("content", []) if isinstance(msg, dict) else getattr(msg, "content", [])
     ) or []
-    texts: List[str] = []
-    for p in parts:
-        if isinstance(p, dict):
-            t = p.get("text")
-            if isinstance(t, dict):
-                v = t.get("value")
-                if isinstance(v, str) and v.strip():
-                    texts.append(v.strip())
-            v = p.get("value")
-            if isinstance(v, str) and v.strip():
-                texts.append(v.strip())
-            continue
+    # part별 분기는 _extract_text로 옮기고, 결합은 C 구현 map/filter/join에 맡긴다
+    content = " ".join(filter(None, map(_extract_text, parts))).strip()
 
-        txt_obj = getattr(p, "text", None)
-        if txt_obj is not None:
-            v = getattr(txt_obj, "value", None)
-            if isinstance(v, str) and v.strip():
-                texts.append(v.strip())
-                continue
-        v = getattr(p, "value", None)
-        if isinstance(v, str) and v.strip():
-            texts.append(v.strip())
+    if not content:
+        preview = _safe_preview(parts)
+        raise NewsError(f"응답 텍스트 없음. content parts 미리보기: {preview}")
 
-    if not texts:
+    return content
 
-        def _safe_preview(o, limit=400):
-            try:
-                if not isinstance(o, (str, int, float, bool, type(None), list, dict)):
-                    o = getattr(o, "__dict__", str(o))
-                return json.dumps(o, ensure_ascii=False, default=str)[:limit] + "..."
-            except Exception:
-                return str(o)[:limit] + "..."
 
-        preview = _safe_preview(parts)
-        raise NewsError(f"응답 텍스트 없음. content parts 미리보기: {preview}")
+_JSON_DECODER = json.JSONDecoder()
 
-    content = " ".join(texts).strip()
-    if not content:
-        raise NewsError("assistant 응답이 비어 있습니다.")
+# 코드펜스 제거: strip("`")는 본문 내부의 백틱까지 건드릴 수 있어 앞뒤 펜스만 정확히 벗긴다
+_FENCE_RE = re.compile(r"\A```(?:json)?\s*|\s*```\Z", re.S)
+
+
+def _strip_fence(t: str) -> str:
+    if t.startswith("```"):
+        return _FENCE_RE.sub("", t)
+    return t
 
-    return content
+
+def _scan_json_array(t: str) -> Optional[str]:
+    """첫 번째 유효한 최상위 JSON 배열 구간을 찾아 반환.
+
+    각 '[' 후보에서 raw_decode를 시도하므로 문자열 리터럴 안의 대괄호에
+    속지 않고, 반환 구간은 이미 파싱 가능함이 보장된다(C 구현 스캐너 사용).
+    """
+    idx = t.find("[")
+    while idx != -1:
+        try:
+            obj, end = _JSON_DECODER.raw_decode(t, idx)
+        except ValueError:
+            idx = t.find("[", idx + 1)
+            continue
+        if isinstance(obj, list):
+            return t[idx:end]
+        idx = t.find("[", end)
+    return None
 
 
 def _extract_json_array(text: str) -> Optional[str]:
@@ -441,25 +697,80 @@ def _extract_json_array(text: str) -> Optional[str]:
     if t.lower() in ("null", "none"):
         return "[]"
 
-    if t.startswith("```"):
-        t = t.strip("`")
-        t = t.split("\n", 1)[-1]
-
-    l = t.find("[")
-    r = t.rfind("]")
-    if l != -1 and r != -1 and r > l:
-        return t[l : r + 1]
-    # 대괄호가 없어도, 이미 배열일 수 있음 (ex: "[]")
-    if t == "[]" or (t.startswith("[") and t.endswith("]")):
-        return t
-    return None
+    t = _strip_fence(t)
+
+    return _scan_json_array(t)
+
+
+def _build_news_prompt(q: str, count: int, freshness: str, market: str) -> str:
+    return f"""
+아래 조건으로 Grounding with Bing Search를 사용해 최신 뉴스를 찾아라.
+- market: {market}
+- freshness: {freshness}   # Day | Week | Month
+- count: {count}
+
+반드시 아래 '정확한' JSON 객체만 출력하라. 설명/주석/코드펜스/앞뒤 텍스트 모두 금지.
+결과가 하나도 없으면 {{"items": []}} 만 출력하라.
+{{"items": [
+  {{"title":"...", "snippet":"...", "source":"...", "published":"YYYY-MM-DDTHH:MM:SSZ", "url":"..."}}
+]}}
+질의: {q}
+"""
+
+
+def _extract_news_items(raw: str) -> list:
+    """응답에서 뉴스 배열을 꺼낸다.
+
+    JSON 모드 응답은 {"items": [...]} 객체로 오고, 구형 응답은 최상위 배열이다.
+    둘 다 받아들이므로 파싱 실패 시의 에이전트 재실행 경로가 필요 없다.
+    """
+    t = _strip_fence((raw or "").strip())
+
+    idx = t.find("{")
+    while idx != -1:
+        try:
+            obj, end = _JSON_DECODER.raw_decode(t, idx)
+        except ValueError:
+            idx = t.find("{", idx + 1)
+            continue
+        if isinstance(obj, dict) and isinstance(obj.get("items"), list):
+            return obj["items"]
+        idx = t.find("{", end)
+
+    # 최상위 배열(구형 프롬프트 형식) 폴백
+    return _loads_news_array(_extract_json_array(raw) or "[]", raw)
+
+
+def _loads_news_array(raw_json: str, raw: str) -> list:
+    try:
+        data = orjson.loads(raw_json) if orjson is not None else json.loads(raw_json)
+        if not isinstance(data, list):
+            raise ValueError("응답이 리스트(JSON 배열)가 아닙니다.")
+        return data
+    except Exception as e:
+        preview = _safe_preview(raw)
+        raise NewsError(f"JSON 파싱 실패: {e}\n응답 미리보기: {preview}")
+
+
+# 동일 질의 반복(사이트 필터 미세조정 등) 시 5~30초짜리 에이전트 재실행을 피한다.
+_search_cache: TTLCache = TTLCache(maxsize=128, ttl=300)
+_search_cache_lock = threading.Lock()
 
 
+def _search_cache_key(
+    q: str, count: int = 10, freshness: str = "Week", market: str = "ko-KR"
+):
+    # 질의는 strip만 하고 그대로 키에 쓴다 — 불리언/따옴표를 지워 정규화하면
+    # 의미가 다른 질의("KT AND 5G" vs "KT OR 5G")가 한 엔트리를 공유하게 된다
+    return hashkey((q or "").strip(), count, freshness, market)
+
+
+@cached(_search_cache, key=_search_cache_key, lock=_search_cache_lock)
 def search_news(
     q: str, count: int = 10, freshness: str = "Week", market: str = "ko-KR"
 ) -> List[Dict[str, Any]]:
     """
-    Grounding with Bing Search로 최신 뉴스 수집 → JSON 배열 파싱
+    Grounding with Bing Search로 최신 뉴스 수집 → JSON 배열 파싱 (5분 TTL 캐시)
     """
     if count < 1:
         count = 1
@@ -468,86 +779,118 @@ def search_news(
 
     agent = _ensure_agent()
 
-    user_prompt = f"""
-아래 조건으로 Grounding with Bing Search를 사용해 최신 뉴스를 찾아라.
+    user_prompt = _build_news_prompt(q, count, freshness, market)
+    raw = _run_and_wait(agent_id=agent["id"], prompt=user_prompt, timeout_sec=180)
+
+    data = _extract_news_items(raw)
+
+    return _postprocess_items(data, freshness)
+
+
+def search_news_batch(
+    queries: List[str],
+    count: int = 10,
+    freshness: str = "Week",
+    market: str = "ko-KR",
+) -> List[List[Dict[str, Any]]]:
+    """여러 질의를 한 번의 에이전트 실행으로 처리 (질의당 1 run → N배 절감).
+
+    프롬프트에 질의를 인덱스로 나열하고 {"0": [...], "1": [...]} 형태의
+    JSON 객체를 요구한다. 일괄 응답 파싱에 실패하면 질의별 개별 호출로 폴백.
+    반환은 입력 순서와 같은 결과 리스트의 리스트.
+    """
+    queries = [(q or "").strip() for q in (queries or [])]
+    queries = [q for q in queries if q]
+    if not queries:
+        return []
+    if len(queries) == 1:
+        return [
+            search_news(queries[0], count=count, freshness=freshness, market=market)
+        ]
+
+    if count < 1:
+        count = 1
+    if count > 50:
+        count = 50
+
+    agent = _ensure_agent()
+
+    numbered = "\n".join(f"{i}. {q}" for i, q in enumerate(queries))
+    prompt = f"""
+아래 번호가 붙은 각 질의에 대해 Grounding with Bing Search로 최신 뉴스를 찾아라.
 - market: {market}
 - freshness: {freshness}   # Day | Week | Month
-- count: {count}
-
-반드시 아래 '정확한' JSON 배열만 출력하라. 설명/주석/코드펜스/앞뒤 텍스트 모두 금지.
-결과가 하나도 없으면 빈 배열 [] 만 출력하라.
-[
-  {{"title":"...", "snippet":"...", "source":"...", "published":"YYYY-MM-DDTHH:MM:SSZ", "url":"..."}}
-]
-질의: {q}
-"""
-    raw = _run_and_wait(agent_id=agent["id"], prompt=user_prompt, timeout_sec=180)
+- 질의당 count: {count}
 
-    raw_json = _extract_json_array(raw)
-    if raw_json is None:
-        retry_prompt = (
-            user_prompt
-            + "\n주의: 결과가 없으면 반드시 빈 배열 [] 만 출력하라. 다른 텍스트 금지."
-        )
-        raw2 = _run_and_wait(agent_id=agent["id"], prompt=retry_prompt, timeout_sec=180)
-        raw_json = _extract_json_array(raw2)
+반드시 질의 번호를 키로 하는 '정확한' JSON 객체만 출력하라.
+설명/주석/코드펜스/앞뒤 텍스트 모두 금지. 결과가 없는 질의는 빈 배열 [].
+{{"0": [{{"title":"...", "snippet":"...", "source":"...", "published":"YYYY-MM-DDTHH:MM:SSZ", "url":"..."}}], "1": [...]}}
 
-    if raw_json is None:
-        raw_json = "[]"
+질의 목록:
+{numbered}
+"""
+    raw = _run_and_wait(agent_id=agent["id"], prompt=prompt, timeout_sec=180)
 
     try:
-        data = json.loads(raw_json)
-        if not isinstance(data, list):
-            raise ValueError("응답이 리스트(JSON 배열)가 아닙니다.")
+        t = _strip_fence((raw or "").strip())
+        idx = t.find("{")
+        if idx == -1:
+            raise ValueError("응답에 JSON 객체가 없습니다.")
+        obj, _ = json.JSONDecoder().raw_decode(t, idx)
+        if not isinstance(obj, dict):
+            raise ValueError("응답이 JSON 객체가 아닙니다.")
+        results: List[List[Dict[str, Any]]] = []
+        for i in range(len(queries)):
+            v = obj.get(str(i))
+            results.append(_postprocess_items(v if isinstance(v, list) else [], freshness))
+        return results
     except Exception as e:
+        _log(f"[batch] 일괄 응답 파싱 실패 → 질의별 폴백: {e}")
+        return [
+            search_news(q, count=count, freshness=freshness, market=market)
+            for q in queries
+        ]
 
-        def _safe_preview(o, limit=400):
-            try:
-                return json.dumps(o, ensure_ascii=False, default=str)[:limit] + "..."
-            except Exception:
-                s = "" if o is None else str(o)
-                return s[:limit] + "..."
 
-        preview = _safe_preview(raw)
-        raise NewsError(f"JSON 파싱 실패: {e}\n응답 미리보기: {preview}")
+# 정규화 대상 필드 — intern된 키로 dict 생성 시 해시 재계산을 줄인다
+_FIELDS = tuple(map(sys.intern, ("title", "snippet", "source", "published", "url")))
 
-    items: List[Dict[str, Any]] = []
-
-    for v in data:
-        items.append(
-            {
-                "title": (v.get("title") or "").strip(),
-                "snippet": (v.get("snippet") or "").strip(),
-                "source": (v.get("source") or "").strip(),
-                "published": (v.get("published") or "").strip(),  # ISO 권장
-                "url": (v.get("url") or "").strip(),
-            }
-        )
+
+def _postprocess_items(data: list, freshness: str) -> List[Dict[str, Any]]:
+    """에이전트 응답(JSON 배열)을 정규화하고 KST 윈도우 필터 + 최신순 정렬."""
+    if not data:
+        return []
+
+    # published는 ISO 권장. dict가 아닌 잡음 항목은 버린다.
+    items: List[Dict[str, Any]] = [
+        {k: (v.get(k) or "").strip() for k in _FIELDS}
+        for v in data
+        if isinstance(v, dict)
+    ]
 
     # --- KST 캘린더 윈도우 계산 ---
     win_start_utc, win_end_utc = _kst_calendar_window(freshness)
 
-    kept: List[Dict[str, Any]] = []
-    dropped_due_to_window: List[Dict[str, Any]] = []
-    unparsable: List[Dict[str, Any]] = []
+    # 필터와 정렬이 같은 published 파싱을 공유하도록 (dt, item) 쌍으로 한 번에 처리
+    kept: List[tuple] = []
+    n_dropped = 0
+    n_unparsable = 0
 
     for it in items:
         dt_utc = _parse_dt_utc(it.get("published"))
         if dt_utc is None:
             # ⬅️ published를 못 읽어도 포함 (Bing freshness를 신뢰)
-            unparsable.append(it)
-            kept.append(it)
+            n_unparsable += 1
+            kept.append((None, it))
             continue
 
         if win_start_utc <= dt_utc <= win_end_utc:
-            kept.append(it)
+            kept.append((dt_utc, it))
         else:
-            dropped_due_to_window.append(it)
+            n_dropped += 1
 
     # 결과가 0이면 롤링 윈도우 백업 (Day=24h, Week=7d, Month=30d)
     if not kept:
-        from datetime import timezone, datetime, timedelta
-
         now_utc = datetime.now(timezone.utc)
         days = (
             30
@@ -557,20 +900,187 @@ def search_news(
         for it in items:
             dt_utc = _parse_dt_utc(it.get("published"))
             if dt_utc is None:
-                kept.append(it)
+                kept.append((None, it))
             elif (now_utc - dt_utc) <= timedelta(days=days):
-                kept.append(it)
+                kept.append((dt_utc, it))
 
-    # 최신순 정렬: 날짜 없는 건 제일 뒤로
-    def _sort_key(it):
-        d = _parse_dt_utc(it.get("published"))
-        return (0, d) if d else (1, datetime.fromtimestamp(0, tz=timezone.utc))
-
-    kept.sort(key=_sort_key, reverse=True)
+    # 최신순 정렬: 날짜 없는 건 제일 뒤로 (키는 이미 계산된 dt 재사용)
+    kept.sort(key=lambda p: (0, p[0]) if p[0] else (1, _EPOCH), reverse=True)
 
     # 디버그 힌트
     _log(
-        f"검색 원본 {len(items)}건 → 보존 {len(kept)}건 / 탈락 {len(dropped_due_to_window)}건 / 날짜미상 {len(unparsable)}건"
+        f"검색 원본 {len(items)}건 → 보존 {len(kept)}건 / 탈락 {n_dropped}건 / 날짜미상 {n_unparsable}건"
+    )
+
+    return [it for _, it in kept]
+
+
+# =========================
+# Async 변형 (azure.ai.projects.aio)
+# =========================
+# 단일 이벤트 루프에서 수십 개의 폴링을 인터리브할 수 있어,
+# 스레드 블로킹 없이 진짜 I/O 동시성을 얻는다.
+import asyncio
+
+_async_project_client = None
+_async_credential = None
+
+# run_async용 백그라운드 이벤트 루프 (이미 루프가 도는 컨텍스트 대비)
+_bg_loop = None
+_bg_loop_lock = threading.Lock()
+
+
+def run_async(coro):
+    """동기 컨텍스트(Streamlit 등)에서 *_async API를 호출하기 위한 브리지.
+
+    실행 중인 루프가 없으면 asyncio.run으로 돌리고,
+    이미 루프 안이면 전용 백그라운드 루프에 제출해 결과를 기다린다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    global _bg_loop
+    with _bg_loop_lock:
+        if _bg_loop is None:
+            _bg_loop = asyncio.new_event_loop()
+            threading.Thread(target=_bg_loop.run_forever, daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _bg_loop).result()
+
+
+async def _project_async():
+    global _async_project_client, _async_credential
+    if not PROJECT_ENDPOINT:
+        raise NewsError("AZURE_AI_PROJECT_ENDPOINT가 비어 있습니다. (.env 확인)")
+    if _async_project_client is None:
+        from azure.identity.aio import DefaultAzureCredential as _AioCredential
+        from azure.ai.projects.aio import AIProjectClient as _AioProjectClient
+
+        _async_credential = _AioCredential()
+        _async_project_client = _AioProjectClient(
+            endpoint=PROJECT_ENDPOINT, credential=_async_credential
+        )
+        _log(f"AIProjectClient(aio) initialized: endpoint={PROJECT_ENDPOINT}")
+    return _async_project_client
+
+
+async def _run_and_wait_async(agent_id: str, prompt: str, timeout_sec: int = 180) -> str:
+    """_run_and_wait의 async 버전: 폴링 대기 중 이벤트 루프를 양보한다."""
+    client = await _project_async()
+    thread = await client.agents.threads.create()
+    await client.agents.messages.create(
+        thread_id=thread["id"], role="user", content=prompt
+    )
+
+    run = await client.agents.runs.create_and_process(
+        thread_id=thread["id"], agent_id=agent_id
+    )
+    _log(f"Run created: run_id={run['id']}")
+
+    start = time.time()
+    TERMINAL_OK = {"completed", "succeeded"}
+    TERMINAL_BAD = {"failed", "cancelled", "expired"}
+
+    delay = 0.25
+    await asyncio.sleep(0.2)
+
+    while True:
+        r = await client.agents.runs.get(thread_id=thread["id"], run_id=run["id"])
+        status = (r.get("status") or "").lower()
+        _log(f"Run status: {status}")
+
+        if status in TERMINAL_OK:
+            break
+        if status in TERMINAL_BAD:
+            last_err = r.get("last_error") or ""
+            raise NewsError(f"에이전트 실행 실패: {status} {last_err}")
+
+        if time.time() - start > timeout_sec:
+            raise NewsError("에이전트 응답 대기 시간 초과")
+
+        retry_after = r.get("retry_after")
+        if retry_after:
+            await asyncio.sleep(float(retry_after))
+        else:
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(delay * 1.5, 5.0)
+
+    try:
+        msg = await client.agents.messages.get_last_message_by_role(
+            thread_id=thread["id"], role="assistant"
+        )
+    except Exception:
+        msgs = [m async for m in client.agents.messages.list(thread_id=thread["id"])]
+        msg = _last_assistant(msgs)
+
+    return _message_text(msg)
+
+
+async def search_news_async(
+    q: str, count: int = 10, freshness: str = "Week", market: str = "ko-KR"
+) -> List[Dict[str, Any]]:
+    """search_news의 async 버전. 에이전트 준비(sync SDK)는 스레드로 우회."""
+    if count < 1:
+        count = 1
+    if count > 50:
+        count = 50
+
+    agent = await asyncio.to_thread(_ensure_agent)
+
+    user_prompt = _build_news_prompt(q, count, freshness, market)
+    raw = await _run_and_wait_async(agent_id=agent["id"], prompt=user_prompt)
+
+    data = _extract_news_items(raw)
+
+    return _postprocess_items(data, freshness)
+
+
+async def search_news_multi_async(
+    q: str,
+    count: int = 30,
+    freshness: str = "Week",
+    market: str = "ko-KR",
+    target_results: int = 20,
+    max_rounds: int = 3,
+) -> List[Dict[str, Any]]:
+    """search_news_multi의 async 버전: 라운드를 asyncio.gather로 동시 실행."""
+    rounds: List[str] = [q]
+    if _has_site_filter(q):
+        rounds.append(_remove_site_filters(q))
+    rounds.append(_simplify_query(q))
+
+    uniq_rounds = []
+    seen_q = set()
+    for rq in rounds:
+        rq = (rq or "").strip()
+        if rq and rq not in seen_q:
+            uniq_rounds.append(rq)
+            seen_q.add(rq)
+
+    need = max(target_results, min(count, 50))
+    per_round = min(need, 20)
+
+    results = await asyncio.gather(
+        *[
+            search_news_async(rq, count=per_round, freshness=freshness, market=market)
+            for rq in uniq_rounds[:max_rounds]
+        ],
+        return_exceptions=True,
     )
 
-    return kept
+    all_items: List[Dict[str, Any]] = []
+    for rq, got in zip(uniq_rounds[:max_rounds], results):
+        if isinstance(got, Exception):
+            _log(f"[multi-async] q='{rq}' 실패: {got}")
+            continue
+        all_items.extend(got)
+    all_items = _dedupe(all_items)
+
+    decorated = [
+        (_parse_dt_utc(it.get("published")) or _EPOCH, i, it)
+        for i, it in enumerate(all_items)
+    ]
+    decorated.sort(key=itemgetter(0), reverse=True)
+
+    return [it for _, _, it in decorated[:need]]
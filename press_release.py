@@ -1,53 +1,165 @@
+import hashlib
 import os
+from functools import lru_cache
+
 from dotenv import load_dotenv
-from openai import AzureOpenAI
+
+from clients import get_openai
+
+# 토큰 단위 잘라내기용 (없으면 문자 기준 폴백)
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
 
 load_dotenv()
 
-client = AzureOpenAI(
-    api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-    api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
-    azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-)
+client = get_openai()
+
+
+@lru_cache(maxsize=1)
+def _encoder():
+    return tiktoken.get_encoding("o200k_base")
 
 
-def _truncate(text: str, max_chars: int = 12000) -> str:
+def _truncate(text: str, max_tokens: int = 6000, max_chars: int = 12000) -> str:
     # 긴 문서에 대한 토큰 초과 가능성 방지
-    # 토큰 관리용 잘라내기
+    # 한국어는 문자수:토큰 비율 편차가 커서 문자 기준 대신 토큰 예산으로 자른다
     if not text:
         return ""
-    return text[:max_chars]
+    if tiktoken is None:
+        return text[:max_chars]
+    toks = _encoder().encode(text)
+    if len(toks) <= max_tokens:
+        return text
+    return _encoder().decode(toks[:max_tokens])
 
 
-def draft_press_release(keywords: str, tone: str = "사회"):
+# 생성 상한/종결 설정: 출력 토큰 수에 비례해 생성 시간이 늘어나므로
+# 상한을 두고, 본문이 끝나면 센티널에서 즉시 멈추게 한다 (stop 문자열은 응답에서 제외됨)
+_MAX_TOKENS = 1200
+_TOP_P = 0.9
+_STOP = ["---END---"]
+
+
+def _stream_chunks(resp):
+    """stream=True 응답에서 텍스트 델타만 순서대로 yield."""
+    for chunk in resp:
+        if chunk.choices:
+            yield chunk.choices[0].delta.content or ""
+
+
+def _draft_resp(keywords: str, tone: str, stream: bool):
     system = (
         "너는 한국 KT 회사 홍보실 직원이다. 제목(한 줄), 서브헤드(한 줄), 본문(3~5단락)을 작성하라. "
-        "한국 언론 보도자료 포맷을 따르고, 사실/수치/인용은 [플레이스홀더]로 표기."
+        "한국 언론 보도자료 포맷을 따르고, 사실/수치/인용은 [플레이스홀더]로 표기. "
+        "본문을 모두 마치면 마지막 줄에 '---END---'만 출력하라."
     )
     user = f"키워드: {keywords}\n매체 톤: {tone}\n출력: 제목/부제/본문"
-    resp = client.chat.completions.create(
+    return client.chat.completions.create(
         model=os.getenv("AZURE_OPENAI_DEPLOYMENT"),
         messages=[
             {"role": "system", "content": system},
             {"role": "user", "content": user},
         ],
         temperature=0.7,
+        max_tokens=_MAX_TOKENS,
+        top_p=_TOP_P,
+        stop=_STOP,
+        stream=stream,
     )
-    return resp.choices[0].message.content
 
 
-def draft_press_release_from_doc(doc_text: str, tone: str = "경제", angle: str = ""):
+@lru_cache(maxsize=128)
+def _draft_cached(keywords: str, tone: str) -> str:
+    # 같은 키워드/톤 재요청은 API 호출 없이 즉시 반환
+    content = _draft_resp(keywords, tone, stream=False).choices[0].message.content
+    return (content or "").replace(_STOP[0], "").strip()
+
+
+def draft_press_release(keywords: str, tone: str = "사회", stream: bool = False):
+    """stream=True면 텍스트 조각 제너레이터 반환 (st.write_stream용). 아니면 전체 문자열.
+
+    비스트리밍 결과는 (키워드, 톤) 기준으로 LRU 캐시된다.
+    스트리밍은 제너레이터라 1회 소비되면 끝이므로 캐시하지 않는다.
+    """
+    if stream:
+        return _stream_chunks(_draft_resp(keywords, tone, stream=True))
+    return _draft_cached((keywords or "").strip(), tone)
+
+
+# 듀얼 초안 출력에서 키워드 기반/문서 기반 구간을 가르는 구분자
+_DUAL_SENTINEL = "===FROM_DOC==="
+
+
+def draft_press_release_dual(
+    keywords: str, doc_text: str, tone: str = "사회", angle: str = ""
+):
+    """키워드 기반 초안과 문서 기반 초안을 '한 번의' 호출로 생성.
+
+    따로 두 번 부르면 HTTP 왕복이 2회 — 합친 프롬프트 1회로 줄이고
+    센티널로 잘라 (키워드 초안, 문서 초안) 튜플을 반환한다.
+    """
+    context = _truncate(doc_text)
+    system = (
+        "너는 한국 KT 회사 홍보실 직원이다. 보도자료 초안을 두 개 작성하라. "
+        "각 초안은 제목(한 줄), 서브헤드(한 줄), 본문(3~5단락)으로 구성하고 한국 언론 보도자료 포맷을 따른다. "
+        "첫 번째 초안은 주어진 키워드만 근거로 하며, 사실/수치/인용은 [플레이스홀더]로 표기한다. "
+        f"첫 번째 초안을 마친 뒤 '{_DUAL_SENTINEL}' 한 줄만 단독으로 출력하고, "
+        "두 번째 초안은 제공된 문서 내용만 근거로 작성하되 문서에 없는 수치/날짜/인용은 [확인 필요]로 남겨라. "
+        "두 초안을 모두 마치면 마지막 줄에 '---END---'만 출력하라."
+    )
+    angle_line = f"\n원하는 각도/포커스: {angle}" if angle else ""
+    user = (
+        f"키워드: {keywords}\n"
+        f"[문서 내용 시작]\n{context}\n[문서 내용 끝]\n"
+        f"매체 톤: {tone}{angle_line}"
+    )
+    resp = client.chat.completions.create(
+        model=os.getenv("AZURE_OPENAI_DEPLOYMENT"),
+        messages=[
+            {"role": "system", "content": system},
+            {"role": "user", "content": user},
+        ],
+        temperature=0.5,
+        max_tokens=2 * _MAX_TOKENS,  # 초안 2개 분량
+        top_p=_TOP_P,
+        stop=_STOP,
+    )
+    text = (resp.choices[0].message.content or "").replace(_STOP[0], "")
+    head, _, tail = text.partition(_DUAL_SENTINEL)
+    return head.strip(), tail.strip()
+
+
+# 문서 본문은 길어서 lru_cache 키로 부적합 → sha256 다이제스트로 키를 만든다
+_doc_draft_cache: dict = {}
+_DOC_DRAFT_CACHE_MAX = 64
+
+
+def draft_press_release_from_doc(
+    doc_text: str, tone: str = "경제", angle: str = "", stream: bool = False
+):
     """
     업로드 문서의 '사실'을 근거로 보도자료 초안 작성.
     - 문서에 없는 내용은 추정하지 말고 [확인 필요]로 표기.
     - 문서 인용이 필요한 경우, 근거 문장을 '근거:' 섹션에 모아 요약.
+    - stream=True면 텍스트 조각 제너레이터 반환 (첫 토큰까지의 체감 지연 단축)
+    - 비스트리밍 결과는 (문서 해시, 톤, 각도) 기준으로 캐시
     """
     context = _truncate(doc_text)
 
+    cache_key = None
+    if not stream:
+        digest = hashlib.sha256(context.encode("utf-8")).hexdigest()
+        cache_key = (digest, tone, angle)
+        if cache_key in _doc_draft_cache:
+            return _doc_draft_cache[cache_key]
+
     system = (
         "너는 한국 KT 회사 홍보실 직원이다. 제공된 문서 내용만 근거로 보도자료 초안을 작성한다."
         "한국 언론 보도자료 포맷을 따르고, 문서에 없는 수치/날짜/인용은 만들지 말고 [확인 필요]로 남겨라. "
-        "출력 형식: 제목(한 줄) → 서브헤드(한 줄) → 본문(3~5단락) → '근거:' 섹션(핵심 사실 요약)."
+        "출력 형식: 제목(한 줄) → 서브헤드(한 줄) → 본문(3~5단락) → '근거:' 섹션(핵심 사실 요약). "
+        "출력을 모두 마치면 마지막 줄에 '---END---'만 출력하라."
     )
     angle_line = f"\n원하는 각도/포커스: {angle}" if angle else ""
     user = (
@@ -63,5 +175,16 @@ def draft_press_release_from_doc(doc_text: str, tone: str = "경제", angle: str
             {"role": "user", "content": user},
         ],
         temperature=0.4,  # 문서 사실 준수 위해 낮춤
+        max_tokens=_MAX_TOKENS,
+        top_p=_TOP_P,
+        stop=_STOP,
+        stream=stream,
     )
-    return resp.choices[0].message.content
+    if stream:
+        return _stream_chunks(resp)
+    result = (resp.choices[0].message.content or "").replace(_STOP[0], "").strip()
+    if len(_doc_draft_cache) >= _DOC_DRAFT_CACHE_MAX:
+        # 단순 FIFO 퇴출 (dict는 삽입 순서 유지)
+        _doc_draft_cache.pop(next(iter(_doc_draft_cache)))
+    _doc_draft_cache[cache_key] = result
+    return result
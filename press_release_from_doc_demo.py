@@ -1,6 +1,6 @@
 import streamlit as st
 from doc_loader import load_text_from_file
-from press_release import draft_press_release_from_doc
+from press_release import draft_press_release_dual, draft_press_release_from_doc
 
 
 def render_press_release_demo():
@@ -13,6 +13,10 @@ def render_press_release_demo():
         "각도/포커스 (선택)",
         placeholder="예: 투자 유치 중심 / 고객 가치 중심 / 기술 혁신 강조",
     )
+    keywords = st.text_input(
+        "키워드 (선택 — 입력 시 키워드 기반 초안도 한 번의 호출로 함께 생성)",
+        placeholder="예: KT, AI 반도체, 투자 유치",
+    )
 
     if uploaded and st.button("문서로 보도자료 생성"):
         with st.spinner("문서 분석 및 보도자료 작성 중..."):
@@ -22,11 +26,23 @@ def render_press_release_demo():
                     st.warning(
                         "문서에서 텍스트를 읽지 못했습니다. PDF 스캔본이면 OCR이 필요할 수 있어요."
                     )
+                elif keywords.strip():
+                    # 키워드 + 문서 둘 다 있으면 한 번의 호출로 두 초안 생성
+                    kw_draft, doc_draft = draft_press_release_dual(
+                        keywords, doc_text, tone=tone, angle=angle
+                    )
+                    st.markdown("#### 📝 키워드 기반 초안")
+                    st.write(kw_draft)
+                    st.markdown("#### 📄 문서 기반 초안")
+                    st.write(doc_draft)
+                    st.success("완료!")
                 else:
-                    result = draft_press_release_from_doc(
-                        doc_text, tone=tone, angle=angle
+                    # 스트리밍 렌더: 첫 토큰부터 바로 표시
+                    st.write_stream(
+                        draft_press_release_from_doc(
+                            doc_text, tone=tone, angle=angle, stream=True
+                        )
                     )
                     st.success("완료!")
-                    st.markdown(result)
             except Exception as e:
                 st.error(f"에러: {e}")
@@ -1,13 +1,22 @@
 # storage_utils.py
 from __future__ import annotations
 
-import os, json, io, traceback, re
+import functools
+import os, json, io, html, mmap, shutil, threading, traceback, re
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
 from typing import Optional, Tuple, List
 from datetime import datetime, timedelta, timezone
 
+import requests
+from requests.adapters import HTTPAdapter
+
+from azure.core.pipeline.transport import RequestsTransport
+
 from azure.storage.blob import (
+    BlobClient,
     BlobServiceClient,
+    ExponentialRetry,
     generate_blob_sas,
     BlobSasPermissions,
     ContentSettings,
@@ -30,10 +39,12 @@ try:
     from docx import Document
     from docx.shared import Pt
     from docx.oxml.ns import qn
+    from docx.oxml import OxmlElement
 except Exception:
     Document = None
     Pt = None
     qn = None
+    OxmlElement = None
 
 # ── ENV ─────────────────────────────────────────────────────────
 CONN_STR = (os.getenv("AZURE_STORAGE_CONNECTION_STRING") or "").strip()
@@ -41,6 +52,24 @@ ACCOUNT_NAME = (os.getenv("AZURE_STORAGE_ACCOUNT") or "").strip()
 ACCOUNT_KEY = (os.getenv("AZURE_STORAGE_KEY") or "").strip()
 CONTAINER = (os.getenv("AZURE_STORAGE_CONTAINER") or "news").strip()
 
+# URL 헬퍼가 계정명 하나 때문에 BlobServiceClient를 띄우지 않도록
+# 연결문자열에서 AccountName을 모듈 로드 시 1회 파싱해 둔다
+_ACCT_NAME = (
+    dict(kv.split("=", 1) for kv in CONN_STR.split(";") if "=" in kv).get(
+        "AccountName", ""
+    )
+    if CONN_STR
+    else ""
+)
+
+# 업로드/다운로드 병렬화: 4MiB를 넘는 본문은 블록 단위로 나눠 동시 전송한다
+MAX_CONCURRENCY = int(os.getenv("AZ_UPLOAD_CONCURRENCY", "8"))
+MAX_SINGLE_PUT = 4 * 1024 * 1024  # 이 크기 이하만 단일 Put으로 전송
+
+# 타임존 객체는 불변이므로 호출마다 만들지 않고 모듈 상수로 공유
+_KST = timezone(timedelta(hours=9))
+_UTC = timezone.utc
+
 _client: Optional[BlobServiceClient] = None
 
 
@@ -55,8 +84,32 @@ def _svc() -> BlobServiceClient:
     if _client:
         return _client
 
+    # SDK 기본 urllib3 풀은 작아서 동시 업로드/HEAD가 소켓 몇 개를 두고 경합한다.
+    # 풀을 넉넉히 잡은 세션을 transport로 넘겨 모든 blob 클라이언트가 공유하게 한다.
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0),
+    )
+    transport = RequestsTransport(
+        session=session, connection_timeout=5, read_timeout=60
+    )
+
+    # 일시적 500/503/타임아웃은 지수 백오프로 재시도 (재시도 폭풍 방지).
+    # 스토리지 SDK는 azure-core의 retry_backoff_* 키워드를 받지 않으므로
+    # ExponentialRetry로 직접 구성한다 (대기 ≈ initial + base^n ± jitter).
+    # 인증 실패(ClientAuthenticationError)는 SDK가 재시도하지 않고 그대로 올라온다.
+    retry_policy = ExponentialRetry(
+        initial_backoff=1, increment_base=2, retry_total=5
+    )
+
     if CONN_STR:
-        _client = BlobServiceClient.from_connection_string(CONN_STR)
+        _client = BlobServiceClient.from_connection_string(
+            CONN_STR,
+            transport=transport,
+            max_single_put_size=MAX_SINGLE_PUT,
+            retry_policy=retry_policy,
+        )
         return _client
 
     if not ACCOUNT_NAME or not ACCOUNT_KEY:
@@ -66,29 +119,74 @@ def _svc() -> BlobServiceClient:
         )
 
     account_url = f"https://{ACCOUNT_NAME}.blob.core.windows.net"
-    _client = BlobServiceClient(account_url=account_url, credential=ACCOUNT_KEY)
+    _client = BlobServiceClient(
+        account_url=account_url,
+        credential=ACCOUNT_KEY,
+        transport=transport,
+        max_single_put_size=MAX_SINGLE_PUT,
+        retry_policy=retry_policy,
+    )
     return _client
 
 
 # ── 폰트 헬퍼 (PDF용 — 지금은 DOCX가 메인) ─────────────────────────
+# PDF마다 폰트 경로 탐색(stat 다수) + TTF 파싱을 반복하지 않도록 프로세스당 1회만 수행
+_NOTO_PATH: Optional[str] = None  # 이미 해석된 노토 폰트 경로 (makedirs/stat 생략용)
+_REGISTERED: set[str] = set()  # pdfmetrics에 등록을 마친 폰트 이름
+
+# 폰트 다운로드/조건부 GET용 — TCP+TLS 핸드셰이크를 재시도 간 재사용
+_FONT_SESSION = requests.Session()
+
+
 def _download_noto_font(font_dir: str = "./fonts") -> Optional[str]:
+    global _NOTO_PATH
+    if _NOTO_PATH:
+        return _NOTO_PATH
     font_url = "https://github.com/googlefonts/noto-cjk/raw/main/Sans/OTF/KR/NotoSansKR-Regular.otf"
     os.makedirs(font_dir, exist_ok=True)
     font_path = os.path.join(font_dir, "NotoSansKR-Regular.otf")
-    if not os.path.exists(font_path):
-        try:
-            import requests
+    etag_path = font_path + ".etag"
 
-            r = requests.get(font_url)
-            r.raise_for_status()
-            with open(font_path, "wb") as f:
-                f.write(r.content)
-        except Exception as e:
-            print(f"폰트 다운로드 실패: {e}")
-            return None
+    headers = {}
+    if os.path.exists(font_path):
+        try:
+            with open(etag_path, encoding="utf-8") as f:
+                headers["If-None-Match"] = f.read().strip()
+        except OSError:
+            # ETag 사이드카가 없으면 로컬 파일을 그대로 신뢰 (재다운로드 안 함)
+            _NOTO_PATH = font_path
+            return font_path
+
+    part_path = font_path + ".part"
+    try:
+        # ~5MB 전체를 r.content로 버퍼링하지 않고 64KiB 청크로 스트리밍 저장.
+        # ETag가 일치하면 서버가 304(본문 없음)로 응답 → 왕복 1회로 끝.
+        r = _FONT_SESSION.get(font_url, headers=headers, stream=True, timeout=15)
+        if r.status_code == 304:
+            _NOTO_PATH = font_path
+            return font_path
+        r.raise_for_status()
+        # 기존 폰트를 직접 덮어쓰지 않고 임시 파일에 받은 뒤 성공 시에만 교체 —
+        # 중간에 끊겨도 잘린 파일이 font_path에 남지 않는다
+        with open(part_path, "wb") as f:
+            shutil.copyfileobj(r.raw, f, length=64 * 1024)
+        os.replace(part_path, font_path)
+        etag = r.headers.get("ETag") or ""
+        if etag:
+            with open(etag_path, "w", encoding="utf-8") as f:
+                f.write(etag)
+    except Exception as e:
+        print(f"폰트 다운로드 실패: {e}")
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
+        return font_path if os.path.exists(font_path) else None
+    _NOTO_PATH = font_path
     return font_path
 
 
+@functools.lru_cache(maxsize=1)
 def _find_korean_font_path() -> Optional[str]:
     env_path = (os.getenv("KOREAN_FONT_PATH") or "").strip()
     if env_path and os.path.exists(env_path):
@@ -114,18 +212,28 @@ def _find_korean_font_path() -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def _register_korean_font(font_name: str = "KFONT") -> Optional[str]:
     try:
         fp = _find_korean_font_path()
         if not fp:
             return None
-        pdfmetrics.registerFont(TTFont(font_name, fp))
+        # 캐시 초기화 후 재진입해도 TTF 재파싱/재등록은 하지 않는다
+        if font_name not in _REGISTERED:
+            pdfmetrics.registerFont(TTFont(font_name, fp))
+            _REGISTERED.add(font_name)
         return font_name
     except Exception:
         return None
 
 
 # ── PDF 생성 (옵션) ─────────────────────────────────────────────
+@functools.lru_cache(maxsize=1)
+def _stylesheet():
+    # getSampleStyleSheet()는 호출마다 스타일 트리를 새로 파싱한다 — 1회만
+    return getSampleStyleSheet()
+
+
 def generate_pdf_bytes(
     items: List[dict],
     *,
@@ -141,7 +249,7 @@ def generate_pdf_bytes(
     )
 
     font_name = _register_korean_font() or "Helvetica"
-    styles = getSampleStyleSheet()
+    styles = _stylesheet()
 
     base = {"fontName": font_name, "fontSize": 11, "leading": 16}
     base_title = {
@@ -165,11 +273,17 @@ def generate_pdf_bytes(
 
     data = [["제목", "매체/시간", "링크"]]
     for it in items:
-        title_p = Paragraph((it.get("title") or "").replace("\n", " "), style_cell)
-        meta = f"{it.get('source') or '-'} / {it.get('published') or '-'}"
+        # Paragraph는 내용을 인라인 마크업(XML)으로 파싱한다 — 이스케이프는
+        # 항목당 1회만. 링크 컬럼도 Paragraph 유지 (평문자열은 줄바꿈이 안 돼
+        # 긴 URL이 셀 폭을 넘어 옆 컬럼을 덮는다)
+        title_txt = html.escape((it.get("title") or "").replace("\n", " "))
+        title_p = Paragraph(title_txt, style_cell)
+        meta = html.escape(
+            f"{it.get('source') or '-'} / {it.get('published') or '-'}"
+        )
         meta_p = Paragraph(meta, style_cell)
-        url = it.get("url") or "-"
-        url_p = Paragraph(url.replace(" ", ""), style_cell)
+        url = html.escape((it.get("url") or "-").replace(" ", ""))
+        url_p = Paragraph(url, style_cell)
         data.append([title_p, meta_p, url_p])
 
     table = Table(data, colWidths=[250, 120, 150])
@@ -203,7 +317,7 @@ def generate_pdf_bytes(
 
 
 # ── DOCX 생성 ──────────────────────────────────────────────────
-def generate_docx_bytes(
+def _generate_docx_buf(
     items: List[dict],
     *,
     title: str = "뉴스 스크랩 리포트",
@@ -211,10 +325,10 @@ def generate_docx_bytes(
     freshness: str = "",
     market: str = "",
     generated_at: Optional[str] = None,
-) -> bytes:
+) -> io.BytesIO:
     """
-    뉴스 항목을 docx(워드) 파일로 변환하여 바이트 반환. (한글 호환)
-    - 인자 대부분 선택형으로 만들어 기존/새 호출 모두 수용
+    뉴스 항목을 docx로 변환해 BytesIO 버퍼로 반환. (한글 호환)
+    업로드 경로는 이 버퍼를 그대로 스트리밍해 중간 bytes 복사를 피한다.
     """
     if Document is None:
         raise RuntimeError(
@@ -249,22 +363,61 @@ def generate_docx_bytes(
     hdr_cells[1].text = "매체/시간"
     hdr_cells[2].text = "링크"
 
+    # add_row()는 행마다 XML 서브트리 복제 + 스타일 해석을 수행해 수백 항목에서
+    # 비용이 누적된다. w:tr/w:tc 엘리먼트를 직접 만들어 테이블에 일괄 append.
+    def _tc(value: str):
+        tc = OxmlElement("w:tc")
+        p = OxmlElement("w:p")
+        r = OxmlElement("w:r")
+        t = OxmlElement("w:t")
+        t.text = value
+        t.set(qn("xml:space"), "preserve")
+        r.append(t)
+        p.append(r)
+        tc.append(p)
+        return tc
+
+    tbl = table._tbl
     for it in items:
-        row_cells = table.add_row().cells
-        row_cells[0].text = (it.get("title") or "").replace("\n", " ")
-        meta = f"{it.get('source') or '-'} / {it.get('published') or '-'}"
-        row_cells[1].text = meta
-        row_cells[2].text = it.get("url") or "-"
+        tr = OxmlElement("w:tr")
+        tr.append(_tc((it.get("title") or "").replace("\n", " ")))
+        tr.append(_tc(f"{it.get('source') or '-'} / {it.get('published') or '-'}"))
+        tr.append(_tc(it.get("url") or "-"))
+        tbl.append(tr)
 
     buf = io.BytesIO()
     doc.save(buf)
-    return buf.getvalue()
+    return buf
+
+
+def generate_docx_bytes(
+    items: List[dict],
+    *,
+    title: str = "뉴스 스크랩 리포트",
+    query: str = "",
+    freshness: str = "",
+    market: str = "",
+    generated_at: Optional[str] = None,
+) -> bytes:
+    """bytes가 필요한 호출부(다운로드 버튼 등)용 호환 래퍼."""
+    return _generate_docx_buf(
+        items,
+        title=title,
+        query=query,
+        freshness=freshness,
+        market=market,
+        generated_at=generated_at,
+    ).getvalue()
 
 
 # ── 파일명 유틸 (옵션) ──────────────────────────────────────────
+# 파일명 슬러그 패턴 — 호출마다 re의 패턴 캐시 조회를 타지 않도록 모듈 로드 시 컴파일
+_SLUG_RE = re.compile(r"[^0-9A-Za-z가-힣]+")
+
+
 def make_pdf_filename_from_query(query: str, include_date: bool = True) -> str:
     q = (query or "").strip() or "pressm"
-    slug = re.sub(r"[^0-9A-Za-z가-힣]+", "_", q).strip("_")
+    slug = _SLUG_RE.sub("_", q).strip("_")
     if include_date:
         today = datetime.now().strftime("%Y%m%d")
         return f"pdf/{slug}_{today}.pdf"
@@ -273,7 +426,7 @@ def make_pdf_filename_from_query(query: str, include_date: bool = True) -> str:
 
 def make_docx_filename_from_query(query: str, include_date: bool = True) -> str:
     q = (query or "").strip() or "pressm"
-    slug = re.sub(r"[^0-9A-Za-z가-힣]+", "_", q).strip("_")
+    slug = _SLUG_RE.sub("_", q).strip("_")
     if include_date:
         today = datetime.now().strftime("%Y%m%d")
         return f"docx/{slug}_{today}.docx"
@@ -281,23 +434,41 @@ def make_docx_filename_from_query(query: str, include_date: bool = True) -> str:
 
 
 # ── Container ───────────────────────────────────────────────────
+# create-or-409 확인은 프로세스당 1회면 충분 — 업로드마다 왕복하지 않는다
+_CONTAINER_OK: set[str] = set()
+_container_lock = threading.Lock()
+
+
 def ensure_container():
-    svc = _svc()
-    if not CONTAINER.islower():
-        raise RuntimeError(
-            "AZURE_STORAGE_CONTAINER는 반드시 소문자여야 합니다. (예: news)"
-        )
-    try:
-        svc.create_container(CONTAINER)
-    except Exception as e:
-        s = str(e)
-        if "ContainerAlreadyExists" in s or "Conflict" in s:
+    if CONTAINER in _CONTAINER_OK:
+        return
+    with _container_lock:
+        if CONTAINER in _CONTAINER_OK:
             return
-        raise
+        svc = _svc()
+        if not CONTAINER.islower():
+            raise RuntimeError(
+                "AZURE_STORAGE_CONTAINER는 반드시 소문자여야 합니다. (예: news)"
+            )
+        try:
+            svc.create_container(CONTAINER)
+        except Exception as e:
+            s = str(e)
+            if "ContainerAlreadyExists" in s or "Conflict" in s:
+                _CONTAINER_OK.add(CONTAINER)
+                return
+            raise
+        _CONTAINER_OK.add(CONTAINER)
+
+
+@functools.lru_cache(maxsize=512)
+def _bc(container: str, blob: str) -> BlobClient:
+    """BlobClient 생성은 URL/파이프라인 조립 비용이 있으므로 경로별로 캐시."""
+    return _svc().get_blob_client(container, blob)
 
 
 def blob_exists(container: str, blob_path: str) -> bool:
-    return _svc().get_blob_client(container, blob_path).exists()
+    return _bc(container, blob_path).exists()
 
 
 # ── Upload / Download ───────────────────────────────────────────
@@ -310,9 +481,14 @@ def upload_json(obj, *, prefix: str = "news/json") -> Tuple[str, str]:
     data = json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
     content = ContentSettings(content_type="application/json; charset=utf-8")
 
-    bc = _svc().get_blob_client(CONTAINER, blob_path)
+    bc = _bc(CONTAINER, blob_path)
     try:
-        bc.upload_blob(data, overwrite=True, content_settings=content)
+        bc.upload_blob(
+            data,
+            overwrite=True,
+            content_settings=content,
+            max_concurrency=MAX_CONCURRENCY,
+        )
         return CONTAINER, blob_path
     except ClientAuthenticationError as e:
         raise RuntimeError(f"[auth] 인증 실패: {e}")
@@ -323,9 +499,9 @@ def upload_json(obj, *, prefix: str = "news/json") -> Tuple[str, str]:
 
 
 def download_bytes(container: str, blob: str) -> bytes:
-    bc = _svc().get_blob_client(container=container, blob=blob)
+    bc = _bc(container, blob)
     try:
-        stream = bc.download_blob()
+        stream = bc.download_blob(max_concurrency=MAX_CONCURRENCY)
         return stream.readall()
     except ResourceNotFoundError as e:
         raise RuntimeError(f"Blob을 찾을 수 없습니다: {container}/{blob} — {e}")
@@ -335,16 +511,26 @@ def download_bytes(container: str, blob: str) -> bytes:
 
 # ── URL / SAS ───────────────────────────────────────────────────
 def public_blob_url(container: str, blob: str) -> str:
-    acct = ACCOUNT_NAME or (
-        _svc().account_name if hasattr(_svc(), "account_name") else ""
-    )
+    acct = ACCOUNT_NAME or _ACCT_NAME
     return f"https://{acct}.blob.core.windows.net/{container}/{blob}"
 
 
-def sas_url(container: str, blob: str, minutes: int = 120) -> Optional[str]:
-    acct = ACCOUNT_NAME or (
-        _svc().account_name if hasattr(_svc(), "account_name") else ""
+# SAS 서명은 HMAC-SHA256 연산이라 같은 blob의 링크를 연달아 만들 때마다
+# 다시 돌릴 필요가 없다 → 10분 버킷 단위로 토큰을 재사용
+@functools.lru_cache(maxsize=1024)
+def _sas_token_cached(acct: str, container: str, blob: str, minutes: int, bucket: int) -> str:
+    return generate_blob_sas(
+        account_name=acct,
+        account_key=ACCOUNT_KEY,
+        container_name=container,
+        blob_name=blob,
+        permission=BlobSasPermissions(read=True),
+        expiry=datetime.now(_UTC) + timedelta(minutes=minutes),
     )
+
+
+def sas_url(container: str, blob: str, minutes: int = 120) -> Optional[str]:
+    acct = ACCOUNT_NAME or _ACCT_NAME
     if not acct:
         return None
     ak = ACCOUNT_KEY
@@ -354,14 +540,9 @@ def sas_url(container: str, blob: str, minutes: int = 120) -> Optional[str]:
     if not ak:
         return None
 
-    token = generate_blob_sas(
-        account_name=acct,
-        account_key=ak,
-        container_name=container,
-        blob_name=blob,
-        permission=BlobSasPermissions(read=True),
-        expiry=datetime.utcnow() + timedelta(minutes=minutes),
-    )
+    # 버킷 내 재사용으로 유효기간이 최대 10분 짧아지므로 minutes에 여유를 둘 것
+    bucket = int(datetime.now(_UTC).timestamp() // 600)
+    token = _sas_token_cached(acct, container, blob, minutes, bucket)
     return f"https://{acct}.blob.core.windows.net/{container}/{blob}?{token}"
 
 
@@ -371,21 +552,23 @@ def _next_version_name(container: str, base_path: str) -> str:
     base_path: 'news_pdf/2025-10-30.docx' 가 이미 있으면
     'news_pdf/2025-10-30 (1).docx', '... (2).docx' ... 로 증가
     """
-    if not blob_exists(container, base_path):
-        return base_path
-
     if "." in base_path:
         stem, ext = base_path.rsplit(".", 1)
         ext = "." + ext
     else:
         stem, ext = base_path, ""
 
-    n = 1
-    while True:
-        candidate = f"{stem} ({n}){ext}"
-        if not blob_exists(container, candidate):
-            return candidate
-        n += 1
+    # 버전마다 blob_exists HEAD를 반복하는 대신 prefix 목록 1회로 최대 버전을 계산
+    pat = re.compile(rf"^{re.escape(stem)}(?: \((\d+)\))?{re.escape(ext)}$")
+    max_n = -1
+    for b in _svc().get_container_client(container).list_blobs(name_starts_with=stem):
+        m = pat.match(b.name)
+        if m:
+            max_n = max(max_n, int(m.group(1) or 0))
+
+    if max_n < 0:
+        return base_path
+    return f"{stem} ({max_n + 1}){ext}"
 
 
 # ── DOCX 업로드 (요구사항 핵심) ──────────────────────────────────
@@ -399,25 +582,32 @@ def upload_docx_report(
     """
     ensure_container()
 
-    KST = timezone(timedelta(hours=9))
-    d = (kst_date or datetime.now(KST)).date().isoformat()  # YYYY-MM-DD
+    now_kst = kst_date or datetime.now(_KST)
+    d = now_kst.date().isoformat()  # YYYY-MM-DD
     base_blob = f"news_pdf/{d}.docx"
     blob_path = _next_version_name(CONTAINER, base_blob)
 
-    docx_bytes = generate_docx_bytes(
+    buf = _generate_docx_buf(
         items,
         title=f"뉴스 스크랩 리포트 — {d}",
         query=query,
         freshness="",
         market="",
-        generated_at=datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S KST"),
+        generated_at=now_kst.strftime("%Y-%m-%d %H:%M:%S KST"),
     )
 
     content = ContentSettings(
         content_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
     )
-    _svc().get_blob_client(CONTAINER, blob_path).upload_blob(
-        docx_bytes, overwrite=False, content_settings=content
+    # getvalue()의 bytes 복사 없이 버퍼를 그대로 스트리밍 업로드
+    size = buf.getbuffer().nbytes
+    buf.seek(0)
+    _bc(CONTAINER, blob_path).upload_blob(
+        buf,
+        length=size,
+        overwrite=False,
+        content_settings=content,
+        max_concurrency=MAX_CONCURRENCY,
     )
 
     link = sas_url(CONTAINER, blob_path, minutes=120) or public_blob_url(
@@ -432,9 +622,47 @@ def upload_docx(docx_bytes: bytes, blob_path: str) -> Tuple[str, str]:
     content = ContentSettings(
         content_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
     )
-    bc = _svc().get_blob_client(CONTAINER, blob_path)
+    bc = _bc(CONTAINER, blob_path)
+    try:
+        bc.upload_blob(
+            docx_bytes,
+            overwrite=True,
+            content_settings=content,
+            max_concurrency=MAX_CONCURRENCY,
+        )
+        return CONTAINER, blob_path
+    except ClientAuthenticationError as e:
+        raise RuntimeError(f"[auth] 인증 실패: {e}")
+    except HttpResponseError as e:
+        raise RuntimeError(f"[http] 업로드 실패: {e}")
+    except Exception as e:
+        raise RuntimeError(f"[blob] 업로드 실패: {e}\n{traceback.format_exc()}")
+
+
+def upload_docx_path(path: str, blob_path: str) -> Tuple[str, str]:
+    """디스크의 DOCX 파일을 메모리 복사 없이 업로드.
+
+    read()로 전체를 들고 오는 대신 mmap으로 매핑해 SDK가 구간별로
+    읽어가게 한다 — 파일이 커도 RSS가 파일 크기만큼 부풀지 않는다.
+    """
+    ensure_container()
+    content = ContentSettings(
+        content_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    )
+    bc = _bc(CONTAINER, blob_path)
     try:
-        bc.upload_blob(docx_bytes, overwrite=True, content_settings=content)
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                bc.upload_blob(
+                    mm,
+                    length=mm.size(),
+                    overwrite=True,
+                    content_settings=content,
+                    max_concurrency=MAX_CONCURRENCY,
+                )
+            finally:
+                mm.close()
         return CONTAINER, blob_path
     except ClientAuthenticationError as e:
         raise RuntimeError(f"[auth] 인증 실패: {e}")
@@ -444,12 +672,154 @@ def upload_docx(docx_bytes: bytes, blob_path: str) -> Tuple[str, str]:
         raise RuntimeError(f"[blob] 업로드 실패: {e}\n{traceback.format_exc()}")
 
 
+# ── 서버 측 복사 ─────────────────────────────────────────────────
+def copy_blob(src_blob: str, dst_blob: str) -> tuple[str, str]:
+    """컨테이너 내 blob을 서버 측 복사로 복제 (아카이브/스냅샷용).
+
+    download_bytes → upload 경유와 달리 본문이 클라이언트를 거치지 않아
+    대역폭 소모가 없다. 원본 접근은 단기 SAS로 위임 — sas_url의 토큰은
+    10분 버킷 단위로 재사용되므로 그만큼 여유를 둔 60분으로 발급한다.
+    return: (container, dst_blob)
+    """
+    src_url = sas_url(CONTAINER, src_blob, minutes=60) or public_blob_url(
+        CONTAINER, src_blob
+    )
+    dst = _bc(CONTAINER, dst_blob)
+    dst.start_copy_from_url(src_url)
+    return CONTAINER, dst_blob
+
+
+# ── 일괄 삭제 ────────────────────────────────────────────────────
+def delete_blobs_batch(paths: List[str]) -> int:
+    """오래된 리포트 버전 등을 Blob Batch API로 일괄 삭제.
+
+    삭제 1건당 1왕복 대신 최대 256건을 한 HTTP 요청에 담는다
+    (delete_blobs가 내부적으로 Blob Batch 요청을 구성).
+    return: 삭제를 요청한 blob 수
+    """
+    paths = [p for p in (paths or []) if p]
+    if not paths:
+        return 0
+    cc = _svc().get_container_client(CONTAINER)
+    for i in range(0, len(paths), 256):  # 배치당 최대 256 서브요청
+        cc.delete_blobs(*paths[i : i + 256])
+    return len(paths)
+
+
+# ── 동시 업로드 (aio) ────────────────────────────────────────────
+# JSON/DOCX/CSV 같은 묶음 업로드를 직렬 3왕복이 아니라 가장 느린 1건 수준으로 줄인다.
+import asyncio
+
+
+async def upload_many(blobs: List[tuple]) -> List[str]:
+    """(blob_path, data, content_type) 목록을 asyncio.gather로 동시 업로드.
+
+    aio 클라이언트 하나를 모든 태스크가 공유하므로 TCP 커넥션도 재사용된다.
+    """
+    from azure.storage.blob.aio import BlobServiceClient as _AioBlobServiceClient
+
+    if CONN_STR:
+        svc = _AioBlobServiceClient.from_connection_string(
+            CONN_STR, max_single_put_size=MAX_SINGLE_PUT
+        )
+    elif ACCOUNT_NAME and ACCOUNT_KEY:
+        svc = _AioBlobServiceClient(
+            account_url=f"https://{ACCOUNT_NAME}.blob.core.windows.net",
+            credential=ACCOUNT_KEY,
+            max_single_put_size=MAX_SINGLE_PUT,
+        )
+    else:
+        raise RuntimeError(
+            "스토리지 인증 정보가 없습니다. "
+            "AZURE_STORAGE_CONNECTION_STRING 또는 (AZURE_STORAGE_ACCOUNT + AZURE_STORAGE_KEY) 를 설정하세요."
+        )
+
+    async def _one(path: str, data, ctype: str) -> str:
+        bc = svc.get_blob_client(CONTAINER, path)
+        await bc.upload_blob(
+            data,
+            overwrite=True,
+            content_settings=ContentSettings(content_type=ctype),
+            max_concurrency=MAX_CONCURRENCY,
+        )
+        return path
+
+    async with svc:
+        return list(await asyncio.gather(*[_one(p, d, c) for p, d, c in blobs]))
+
+
+def upload_report_bundle(items: List[dict], *, query: str = "") -> tuple[str, List[str]]:
+    """같은 결과셋의 JSON + DOCX + CSV 리포트를 동시 업로드하는 동기 래퍼.
+
+    return: (container, 업로드된 blob 경로 목록)
+    """
+    ensure_container()
+
+    now_kst = datetime.now(_KST)
+    d = now_kst.date().isoformat()
+    ts = now_kst.strftime("%H%M%S")
+
+    json_bytes = json.dumps(items, ensure_ascii=False, indent=2).encode("utf-8")
+    docx_bytes = generate_docx_bytes(
+        items,
+        title=f"뉴스 스크랩 리포트 — {d}",
+        query=query,
+        generated_at=now_kst.strftime("%Y-%m-%d %H:%M:%S KST"),
+    )
+    csv_bytes = to_csv_bytes(items)
+
+    blobs = [
+        (
+            f"news/json/{d}/pressm_{ts}.json",
+            json_bytes,
+            "application/json; charset=utf-8",
+        ),
+        (
+            f"news_pdf/{d}_{ts}.docx",
+            docx_bytes,
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        ),
+        (f"news/csv/{d}/pressm_{ts}.csv", csv_bytes, "text/csv; charset=utf-8"),
+    ]
+    return CONTAINER, asyncio.run(upload_many(blobs))
+
+
+# ── DOCX 비동기 생성 ────────────────────────────────────────────
+# lxml 직렬화(zip + XML)는 순수 CPU 작업이라 async 핸들러에서 수백 ms씩
+# 이벤트 루프를 막는다 → 워커 프로세스로 내려 GIL 밖에서 돌린다.
+_docx_exec: Optional[ProcessPoolExecutor] = None
+_docx_exec_lock = threading.Lock()
+
+
+def _docx_executor() -> ProcessPoolExecutor:
+    global _docx_exec
+    if _docx_exec is None:
+        with _docx_exec_lock:
+            if _docx_exec is None:
+                _docx_exec = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _docx_exec
+
+
+async def generate_docx_bytes_async(items: List[dict], **kwargs) -> bytes:
+    """generate_docx_bytes의 async 버전 — 이벤트 루프를 막지 않는다.
+
+    upload_many와 조합하면 동시 요청에서 생성과 업로드가 겹친다.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _docx_executor(), functools.partial(generate_docx_bytes, items, **kwargs)
+    )
+
+
 # ── CSV 변환 ─────────────────────────────────────────────────────
 def to_csv_bytes(items: List[dict]) -> bytes:
     import csv
 
-    buf = io.StringIO()
-    w = csv.writer(buf)
+    # StringIO에 쓰고 getvalue() 복사 + encode() 복사를 거치는 대신
+    # TextIOWrapper로 UTF-8 바이트를 BytesIO에 한 번에 기록
+    buf = io.BytesIO()
+    text = io.TextIOWrapper(buf, encoding="utf-8", newline="", write_through=True)
+    w = csv.writer(text)
     w.writerow(["title", "source", "published", "url", "snippet"])
     for it in items:
         w.writerow(
@@ -461,4 +831,6 @@ def to_csv_bytes(items: List[dict]) -> bytes:
                 it.get("snippet", ""),
             ]
         )
-    return buf.getvalue().encode("utf-8")
+    text.flush()
+    text.detach()  # buf가 wrapper GC에 딸려 닫히지 않게 분리
+    return buf.getvalue()